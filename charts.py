@@ -197,6 +197,119 @@ def create_interactive_chart(ts: pd.DataFrame,
     # Ensure timestamp column is datetime
     ts['timestamp'] = pd.to_datetime(ts['timestamp'])
 
+    chart_status.text("🎨 Building chart figure...")
+    chart_progress.progress(60)
+
+    # Figure construction is cached and shared across sessions, so size a copy per render
+    fig = go.Figure(_build_interactive_figure(ts, item_name, current_timestep))
+    fig.update_layout(height=height, width=width)
+
+    # Interactive Price Display JavaScript
+    interactive_js = f"""
+    <script>
+    function updatePriceDisplay(eventdata) {{
+        if (eventdata && eventdata.points && eventdata.points.length > 0) {{
+            var point = eventdata.points[0];
+            var timestamp = point.x;
+            var price = point.y;
+            var trace_name = point.data.name;
+
+            // Update display element if it exists
+            var display = document.getElementById('price-display-{item_name.replace(" ", "-")}');
+            if (display) {{
+                display.innerHTML = '<b>' + trace_name + '</b>: ' + 
+                                  price.toLocaleString() + ' gp<br>' +
+                                  '<small>' + new Date(timestamp).toLocaleString() + '</small>';
+            }}
+        }}
+    }}
+
+    // Add event listener when chart is ready
+    document.addEventListener('DOMContentLoaded', function() {{
+        var plotDiv = document.querySelector('[data-testid="stPlotlyChart"]');
+        if (plotDiv) {{
+            plotDiv.on('plotly_hover', updatePriceDisplay);
+        }}
+    }});
+    </script>
+
+    <div id="price-display-{item_name.replace(' ', '-')}" 
+         style="position: fixed; top: 100px; right: 20px; 
+                background: rgba(30, 30, 30, 0.9); 
+                color: white; padding: 10px; 
+                border-radius: 5px; border: 1px solid rgba(100, 200, 100, 0.5);
+                z-index: 1000; font-family: Consolas;
+                display: none;">
+        Hover over chart to see price details
+    </div>
+    """
+
+    # Add the interactive JavaScript to Streamlit
+    st.markdown(interactive_js, unsafe_allow_html=True)
+
+    chart_status.text("🚀 Rendering interactive chart...")
+    chart_progress.progress(80)
+
+    # Display the enhanced interactive chart
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        key=f"chart_{item_name}_{current_timestep}",
+        config={
+            'displayModeBar': True,
+            'displaylogo': False,
+            'modeBarButtonsToAdd': [
+                'drawline',
+                'drawopenpath',
+                'drawclosedpath',
+                'drawcircle',
+                'drawrect',
+                'eraseshape'
+            ],
+            'modeBarButtonsToRemove': [
+                'lasso2d',
+                'select2d'
+            ],
+            'toImageButtonOptions': {
+                'format': 'png',
+                'filename': f'{item_name}_chart_{current_timestep}',
+                'height': height,
+                'width': width,
+                'scale': 2
+            },
+            'scrollZoom': True,
+            'doubleClick': 'reset+autosize',
+            'showTips': True,
+            'responsive': True
+        }
+    )
+
+    chart_progress.progress(100)
+    chart_status.text("✅ Chart ready!")
+
+    # Clear progress indicators
+    import time
+    time.sleep(0.5)
+    chart_progress.empty()
+    chart_status.empty()
+
+    # Add chart interaction controls
+    show_chart_controls(ts, item_name, current_timestep)
+
+    # Reference line information panel
+    show_reference_info(ts, item_name)
+
+    # Chart statistics and volume insights
+    show_chart_statistics(ts, item_name, current_timestep)
+    show_volume_insights(ts, item_name)
+    show_fill_area_analysis(ts, item_name)
+
+
+@st.cache_resource(max_entries=32, ttl=600,
+                   hash_funcs={pd.DataFrame: lambda df: (len(df), df['timestamp'].iloc[-1])})
+def _build_interactive_figure(ts: pd.DataFrame, item_name: str, current_timestep: str):
+    """Build the interactive Plotly figure, cached per item, timestep and data fingerprint"""
+
     # Create enhanced chart
     fig = make_subplots(
         rows=2, cols=1,
@@ -259,7 +372,7 @@ def create_interactive_chart(ts: pd.DataFrame,
 
     # Enhanced Price Fill Areas - Multiple zones for better visualization
     if not ts.empty and len(ts) > 1:
-        from utils import calculate_ge_tax
+        from utils import calculate_ge_tax, calculate_ge_tax_array
 
         # Calculate profitability for each time period
         profitable_periods = []
@@ -271,7 +384,7 @@ def create_interactive_chart(ts: pd.DataFrame,
 
         if len(ts_valid) > 0:
             # Calculate all profits at once
-            ts_valid['ge_tax'] = ts_valid['high'].apply(calculate_ge_tax)
+            ts_valid['ge_tax'] = calculate_ge_tax_array(ts_valid['high'])
             ts_valid['net_profit'] = ts_valid['high'] - ts_valid['low'] - ts_valid['ge_tax']
 
             # Split into categories using boolean indexing
@@ -711,9 +824,6 @@ def create_interactive_chart(ts: pd.DataFrame,
             ), row=2, col=1
         )
 
-    chart_status.text("🎨 Applying professional styling...")
-    chart_progress.progress(60)
-
     # Enhanced Professional Styling
     fig.update_layout(
         template='plotly_dark',
@@ -723,8 +833,6 @@ def create_interactive_chart(ts: pd.DataFrame,
             font=dict(size=22, color='#ffffff', family='Arial Black'),
             pad=dict(t=20, b=10)
         ),
-        height=height,
-        width=width,
         hovermode='x unified',
         margin=dict(t=90, b=60, l=60, r=60),
 
@@ -822,49 +930,6 @@ def create_interactive_chart(ts: pd.DataFrame,
         row=1, col=1
     )
 
-    # Interactive Price Display JavaScript
-    interactive_js = f"""
-    <script>
-    function updatePriceDisplay(eventdata) {{
-        if (eventdata && eventdata.points && eventdata.points.length > 0) {{
-            var point = eventdata.points[0];
-            var timestamp = point.x;
-            var price = point.y;
-            var trace_name = point.data.name;
-
-            // Update display element if it exists
-            var display = document.getElementById('price-display-{item_name.replace(" ", "-")}');
-            if (display) {{
-                display.innerHTML = '<b>' + trace_name + '</b>: ' + 
-                                  price.toLocaleString() + ' gp<br>' +
-                                  '<small>' + new Date(timestamp).toLocaleString() + '</small>';
-            }}
-        }}
-    }}
-
-    // Add event listener when chart is ready
-    document.addEventListener('DOMContentLoaded', function() {{
-        var plotDiv = document.querySelector('[data-testid="stPlotlyChart"]');
-        if (plotDiv) {{
-            plotDiv.on('plotly_hover', updatePriceDisplay);
-        }}
-    }});
-    </script>
-
-    <div id="price-display-{item_name.replace(' ', '-')}" 
-         style="position: fixed; top: 100px; right: 20px; 
-                background: rgba(30, 30, 30, 0.9); 
-                color: white; padding: 10px; 
-                border-radius: 5px; border: 1px solid rgba(100, 200, 100, 0.5);
-                z-index: 1000; font-family: Consolas;
-                display: none;">
-        Hover over chart to see price details
-    </div>
-    """
-
-    # Add the interactive JavaScript to Streamlit
-    st.markdown(interactive_js, unsafe_allow_html=True)
-
     # Professional Grid and Axis Styling - GE Tracker inspired
     fig.update_xaxes(
         showgrid=True,
@@ -1018,62 +1083,8 @@ def create_interactive_chart(ts: pd.DataFrame,
     # Add the annotations to the layout
     fig.update_layout(annotations=annotations)
 
-    chart_status.text("🚀 Rendering interactive chart...")
-    chart_progress.progress(80)
+    return fig
 
-    # Display the enhanced interactive chart
-    st.plotly_chart(
-        fig,
-        use_container_width=True,
-        key=f"chart_{item_name}_{current_timestep}",
-        config={
-            'displayModeBar': True,
-            'displaylogo': False,
-            'modeBarButtonsToAdd': [
-                'drawline',
-                'drawopenpath',
-                'drawclosedpath',
-                'drawcircle',
-                'drawrect',
-                'eraseshape'
-            ],
-            'modeBarButtonsToRemove': [
-                'lasso2d',
-                'select2d'
-            ],
-            'toImageButtonOptions': {
-                'format': 'png',
-                'filename': f'{item_name}_chart_{current_timestep}',
-                'height': height,
-                'width': width,
-                'scale': 2
-            },
-            'scrollZoom': True,
-            'doubleClick': 'reset+autosize',
-            'showTips': True,
-            'responsive': True
-        }
-    )
-
-    chart_progress.progress(100)
-    chart_status.text("✅ Chart ready!")
-
-    # Clear progress indicators
-    import time
-    time.sleep(0.5)
-    chart_progress.empty()
-    chart_status.empty()
-
-    # Add chart interaction controls
-    show_chart_controls(ts, item_name, current_timestep)
-
-    # Reference line information panel
-    show_reference_info(ts, item_name)
-
-    # Chart statistics and volume insights
-    show_chart_statistics(ts, item_name, current_timestep)
-    show_volume_insights(ts, item_name)
-    show_fill_area_analysis(ts, item_name)
 
 def show_chart_statistics(ts: pd.DataFrame, item_name: str, timestep: str):
     """Display chart statistics and analysis"""
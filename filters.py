@@ -6,7 +6,7 @@ Item filtering logic, backtesting, and correlation analysis
 import pandas as pd
 import datetime
 import streamlit as st
-from utils import calculate_ge_tax, categorize_item, get_buy_limits
+from utils import calculate_ge_tax, categorize_series, get_buy_limits
 from analytics import detect_manipulation, calculate_volatility_score, calculate_capital_at_risk
 from data_fetchers import get_timeseries
 
@@ -82,7 +82,6 @@ def filter_items(price_data_result, hourly_data, id2name, show_all=False, mode="
                 momentum = 0
 
             season_ratio = 1.0  # Default value
-            cat = categorize_item(name)
             gl = limits.get(name, 1000)
             roi = round(net / lo * 100, 2) if lo else 0
 
@@ -120,7 +119,7 @@ def filter_items(price_data_result, hourly_data, id2name, show_all=False, mode="
                 'Momentum (%)': momentum,
                 'Season Ratio': season_ratio,
                 'Utility': util,
-                'Category': cat,
+                'Category': None,  # filled in vectorized below
                 'Item ID': iid,
                 'Data Age (min)': data_age_minutes,
                 'High Age (min)': high_age_minutes,
@@ -147,6 +146,7 @@ def filter_items(price_data_result, hourly_data, id2name, show_all=False, mode="
         return pd.DataFrame()
 
     df = pd.DataFrame(recs)
+    df['Category'] = categorize_series(df['Item'])
 
     # Mode-specific handling
     if mode == "High Volume":
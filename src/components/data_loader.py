@@ -150,7 +150,7 @@ def create_debug_section(MIN_MARGIN, MIN_VOLUME, MIN_UTILITY, show_all):
                 default_limits = get_buy_limits()
                 try:
                     with open('ge_limits.json', 'w') as f:
-                        json.dump(default_limits, f, indent=2)
+                        json.dump(dict(default_limits), f, indent=2)
                     st.success("✅ Created ge_limits.json with default buy limits")
                 except Exception as e:
                     st.error(f"❌ Failed to create ge_limits.json: {e}")
@@ -138,7 +138,6 @@ def create_performance_badge():
         font-size: 0.8rem;
         font-weight: 500;
         z-index: 1000;
-        backdrop-filter: blur(10px);
         box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
     ">
         {performance_status} ({hit_rate:.0f}%)
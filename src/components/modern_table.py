@@ -4,6 +4,7 @@ Redesigned table that's easy to scan and mobile-friendly
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 
 # Use relative imports to avoid issues
@@ -35,20 +36,13 @@ def prepare_table_data(df):
 
     display_df = df.copy()
 
-    # Create profit tiers for better visual grouping
-    def get_profit_tier(margin):
-        if margin >= 5000:
-            return "🏆 EXCEPTIONAL"
-        elif margin >= 2000:
-            return "🥇 EXCELLENT"
-        elif margin >= 1000:
-            return "🥈 GOOD"
-        elif margin >= 500:
-            return "🥉 DECENT"
-        else:
-            return "⚠️ LOW"
-
-    display_df['Profit Tier'] = display_df['Net Margin'].apply(get_profit_tier)
+    # Create profit tiers for better visual grouping, in one pass over the margin column
+    margin = display_df['Net Margin'].to_numpy()
+    display_df['Profit Tier'] = np.select(
+        [margin >= 5000, margin >= 2000, margin >= 1000, margin >= 500],
+        ["🏆 EXCEPTIONAL", "🥇 EXCELLENT", "🥈 GOOD", "🥉 DECENT"],
+        default="⚠️ LOW"
+    )
 
     # Create risk ratings
     def get_risk_rating(row):
@@ -199,42 +193,42 @@ def display_modern_table_cards(df, start_idx):
         create_item_card(row, start_idx + idx)
 
 
+# Stable class names for each profit tier, styled by the main stylesheet
+TIER_CLASSES = {
+    "🏆 EXCEPTIONAL": "tier-exceptional",
+    "🥇 EXCELLENT": "tier-excellent",
+    "🥈 GOOD": "tier-good",
+    "🥉 DECENT": "tier-decent",
+    "⚠️ LOW": "tier-low"
+}
+
+# Card accent color for each profit tier
+TIER_COLORS = {
+    "🏆 EXCEPTIONAL": "#FFD700",
+    "🥇 EXCELLENT": "#32CD32",
+    "🥈 GOOD": "#4A90E2",
+    "🥉 DECENT": "#FF8C00",
+    "⚠️ LOW": "#FF6B6B"
+}
+
+
 def create_item_card(row, idx):
     """Create a simple, leak-proof card for each item"""
 
     # Determine card accent color based on profit tier
-    tier_colors = {
-        "🏆 EXCEPTIONAL": "#FFD700",
-        "🥇 EXCELLENT": "#32CD32",
-        "🥈 GOOD": "#4A90E2",
-        "🥉 DECENT": "#FF8C00",
-        "⚠️ LOW": "#FF6B6B"
-    }
-
-    accent_color = tier_colors.get(row['Profit Tier'], "#4A90E2")
+    accent_color = TIER_COLORS.get(row['Profit Tier'], "#4A90E2")
+    tier_class = TIER_CLASSES.get(row['Profit Tier'], "tier-good")
 
     # Use Streamlit containers and columns for layout
     with st.container():
-        # Card border with color
+        # Card header with item name and tier - one markup block, so the card class wraps it
         st.markdown(f"""
-        <div style="
-            background: rgba(255, 255, 255, 0.06);
-            border: 1px solid rgba(255, 255, 255, 0.12);
-            border-left: 4px solid {accent_color};
-            border-radius: 12px;
-            padding: 20px;
-            margin: 12px 0;
-        ">
+        <div class="osrs-item-card" style="border-left-color: {accent_color};">
+            <strong>🎯 {row['Item']}</strong>
+            <span class='osrs-tier {tier_class}'>{row['Profit Tier']}</span>
+        </div>
         """, unsafe_allow_html=True)
 
-        # Header row with item name and tier
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.markdown(f"**🎯 {row['Item']}**")
-        with col2:
-            st.markdown(f"<span style='color: {accent_color}; font-size: 0.8rem;'>{row['Profit Tier']}</span>",
-                       unsafe_allow_html=True)
-
         # Main info row using Streamlit metrics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -265,9 +259,6 @@ def create_item_card(row, idx):
         with col4:
             st.write(f"**Risk:** {row['Risk Rating']}")
 
-        # Close the card div
-        st.markdown("</div>", unsafe_allow_html=True)
-
 
 def create_modern_pagination(total_pages, total_items, start_idx, end_idx):
     """Create modern pagination controls"""
@@ -131,10 +131,8 @@ def create_performance_badge_advanced():
         font-size: 0.85rem;
         font-weight: 600;
         z-index: 1000;
-        backdrop-filter: blur(10px);
         box-shadow: 0 6px 20px rgba(0, 0, 0, 0.3);
         cursor: pointer;
-        transition: all 0.3s ease;
     " title="Cache: {perf_stats['hit_rate']:.1f}% | Load: {avg_time:.1f}s">
         {status}
     </div>
@@ -5,7 +5,7 @@ Handles the display of flip opportunities in a table format
 
 import streamlit as st
 import pandas as pd
-from utils import calculate_ge_tax, get_buy_limits
+from utils import calculate_ge_tax_array, get_buy_limits
 from src.utils.error_handler import safe_execute, ErrorHandler
 
 
@@ -109,7 +109,7 @@ def process_dataframe_for_display(df):
     display_df['Approx. Sell Price'] = display_df.apply(
         lambda row: format_price_with_freshness(row['Sell Price'], row['High Age (min)']),
         axis=1)
-    display_df['Tax'] = display_df['Sell Price'].apply(lambda x: f"{calculate_ge_tax(x):,}")
+    display_df['Tax'] = [f"{tax:,}" for tax in calculate_ge_tax_array(display_df['Sell Price'])]
     display_df['GE Limit'] = display_df['Item'].apply(
         lambda x: f"{limits.get(x, 'N/A'):,}" if limits.get(x) else "N/A")
 
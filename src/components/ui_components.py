@@ -88,13 +88,11 @@ def create_metric_card(label, value, delta=None, icon="📊", color="#4A90E2"):
     card_html = f"""
     <div style="
         background: rgba(255, 255, 255, 0.06);
-        backdrop-filter: blur(20px);
         border: 1px solid rgba(255, 255, 255, 0.12);
         border-radius: 16px;
         padding: 24px;
         margin: 16px 0;
         box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
         text-align: center;
     ">
         <div style="font-size: 1.5rem; margin-bottom: 12px;">{icon}</div>
@@ -3,6 +3,7 @@ Charts Page Component
 Dedicated page for item chart analysis
 """
 
+import numpy as np
 import streamlit as st
 import requests
 from data_fetchers import get_item_mapping, get_timeseries_custom
@@ -207,58 +208,88 @@ def display_chart_debug_info(selected_item, item_id=None, timestep=None, time_pe
                 st.write(f"**API Error:** {e}")
 
 
-def display_chart_analysis(ts, item_name, time_period):
-    """Display analysis of the chart data"""
+_METRIC_CARD = (
+    '<div class="osrs-metric-card">'
+    '<div class="osrs-metric-label">{label}</div>'
+    '<div class="osrs-metric-value">{value}</div>'
+    '<div class="osrs-metric-delta {delta_class}">{delta}</div>'
+    '</div>'
+)
 
-    st.subheader("📊 Chart Analysis")
 
-    # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
+def _delta_class(delta):
+    """Pick the delta color class for a metric card"""
+    if delta.startswith('-'):
+        return "negative"
+    if delta.startswith('+'):
+        return "positive"
+    return "neutral"
 
-    with col1:
-        current_high = ts['high'].iloc[-1]
-        current_low = ts['low'].iloc[-1]
-        spread = current_high - current_low
-        st.metric(
-            "Current Spread",
-            f"{spread:,.0f} gp",
-            f"{(spread / current_low * 100):+.1f}%"
-        )
 
-    with col2:
-        price_change = ts['high'].iloc[-1] - ts['high'].iloc[0]
-        change_pct = (price_change / ts['high'].iloc[0]) * 100
-        st.metric(
-            f"{time_period} Price Change",
-            f"{price_change:+,.0f} gp",
-            f"{change_pct:+.1f}%"
-        )
+def _compute_analysis(high, low, volume):
+    """Compute every chart-analysis scalar in one call over the price/volume arrays"""
+    current_high = high[-1]
+    current_low = low[-1]
+    spread = current_high - current_low
+    spread_pct = spread / current_low * 100
 
-    with col3:
-        avg_volume = ts['volume'].mean()
-        total_volume = ts['volume'].sum()
-        st.metric(
-            "Average Volume",
-            f"{avg_volume:,.0f}",
-            f"Total: {total_volume:,.0f}"
-        )
+    price_change = current_high - high[0]
+    change_pct = price_change / high[0] * 100
 
-    with col4:
-        volatility = (ts['high'].std() / ts['high'].mean()) * 100
-        st.metric(
-            "Price Volatility",
-            f"{volatility:.1f}%",
-            "Lower is more stable"
-        )
+    # NaNs are skipped to match the pandas reductions this replaces
+    valid_volume = volume[~np.isnan(volume)]
+    total_volume = valid_volume.sum()
+    avg_volume = valid_volume.mean() if valid_volume.size > 0 else np.nan
+
+    valid_high = high[~np.isnan(high)]
+    valid_low = low[~np.isnan(low)]
+
+    volatility = np.nan
+    if valid_high.size > 1:
+        volatility = valid_high.std(ddof=1) / valid_high.mean() * 100
+
+    resistance = np.quantile(valid_high, 0.8) if valid_high.size > 0 else np.nan
+    support = np.quantile(valid_low, 0.2) if valid_low.size > 0 else np.nan
+
+    return (spread, spread_pct, price_change, change_pct, avg_volume, total_volume,
+            volatility, resistance, support)
+
+
+def display_chart_analysis(ts, item_name, time_period):
+    """Display analysis of the chart data"""
+
+    st.subheader("📊 Chart Analysis")
+
+    # Key metrics - computed in a single call over the raw arrays
+    (spread, spread_pct, price_change, change_pct, avg_volume, total_volume,
+     volatility, resistance, support) = _compute_analysis(
+        ts['high'].to_numpy(dtype=np.float64),
+        ts['low'].to_numpy(dtype=np.float64),
+        ts['volume'].to_numpy(dtype=np.float64)
+    )
+
+    metrics = [
+        ("Current Spread", f"{spread:,.0f} gp", f"{spread_pct:+.1f}%"),
+        (f"{time_period} Price Change", f"{price_change:+,.0f} gp", f"{change_pct:+.1f}%"),
+        ("Average Volume", f"{avg_volume:,.0f}", f"Total: {total_volume:,.0f}"),
+        ("Price Volatility", f"{volatility:.1f}%", "Lower is more stable"),
+    ]
+
+    # Render all four cards in a single markdown call
+    cards_html = "".join(
+        _METRIC_CARD.format(label=label, value=value, delta=delta, delta_class=_delta_class(delta))
+        for label, value, delta in metrics
+    )
+    st.markdown(f'<div class="osrs-metric-grid">{cards_html}</div>', unsafe_allow_html=True)
 
     # Price trend analysis
-    display_trend_analysis(ts, time_period)
+    display_trend_analysis(ts, time_period, resistance, support)
 
     # Trading opportunities
-    display_trading_insights(ts, item_name)
+    display_trading_insights(ts, item_name, volatility=volatility, avg_volume=avg_volume)
 
 
-def display_trend_analysis(ts, time_period):
+def display_trend_analysis(ts, time_period, resistance, support):
     """Display price trend analysis"""
 
     st.subheader("📈 Price Trends")
@@ -279,13 +310,11 @@ def display_trend_analysis(ts, time_period):
 
         with col2:
             # Support and resistance levels
-            resistance = ts['high'].quantile(0.8)
-            support = ts['low'].quantile(0.2)
             st.info(f"**Resistance Level:** {resistance:,.0f} gp")
             st.info(f"**Support Level:** {support:,.0f} gp")
 
 
-def display_trading_insights(ts, item_name):
+def display_trading_insights(ts, item_name, volatility, avg_volume):
     """Display trading insights and recommendations"""
 
     st.subheader("💡 Trading Insights")
@@ -304,7 +333,6 @@ def display_trading_insights(ts, item_name):
 
     with col2:
         # Volume analysis
-        avg_volume = ts['volume'].mean()
         vol_trend = "📈 Increasing" if ts['volume'].iloc[-1] > avg_volume else "📉 Decreasing"
         st.info(f"**Volume Trend:** {vol_trend}")
 
@@ -316,7 +344,6 @@ def display_trading_insights(ts, item_name):
 
     with col3:
         # Risk assessment
-        volatility = (ts['high'].std() / ts['high'].mean()) * 100
         price_stability = "High" if volatility < 5 else "Medium" if volatility < 15 else "Low"
         st.info(f"**Price Stability:** {price_stability}")
 
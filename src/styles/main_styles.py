@@ -3,463 +3,292 @@ Modern OSRS-Themed Styling System
 Enhanced visual design for the OSRS Flip Assistant
 """
 
-import streamlit as st
-
-
-def inject_modern_osrs_styles():
-    """Inject modern OSRS-themed CSS styles"""
-    st.markdown("""
-    <style>
-        /* Import modern fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
-
-        /* OSRS Color Palette */
-        :root {
-            --osrs-gold: #FFD700;
-            --osrs-gold-dark: #B8860B;
-            --osrs-blue: #0066CC;
-            --osrs-blue-light: #4A90E2;
-            --osrs-green: #228B22;
-            --osrs-green-light: #32CD32;
-            --osrs-red: #DC143C;
-            --osrs-red-light: #FF6B6B;
-            --osrs-orange: #FF8C00;
-            
-            /* Modern Dark Theme */
-            --bg-primary: #0F0F23;
-            --bg-secondary: #1A1A2E;
-            --bg-tertiary: #16213E;
-            --bg-card: rgba(255, 255, 255, 0.06);
-            --bg-card-hover: rgba(255, 255, 255, 0.1);
-            
-            /* Text Colors */
-            --text-primary: #FFFFFF;
-            --text-secondary: #B0B8C5;
-            --text-muted: #8A94A6;
-            --text-accent: var(--osrs-gold);
-            
-            /* Borders and Shadows */
-            --border-primary: rgba(255, 255, 255, 0.12);
-            --border-accent: rgba(255, 215, 0, 0.3);
-            --shadow-card: 0 8px 32px rgba(0, 0, 0, 0.4);
-            --shadow-button: 0 4px 16px rgba(255, 215, 0, 0.2);
-        }
-
-        /* Global Styles */
-        .stApp {
-            background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-secondary) 50%, var(--bg-tertiary) 100%) !important;
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-            color: var(--text-primary) !important;
-        }
+import hashlib
+import json
+import re
+from functools import cache
+from importlib.resources import files
+from pathlib import Path
 
-        /* Hide Streamlit branding */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        .stDeployButton {visibility: hidden;}
-
-        /* Enhanced Container Styling */
-        .main .block-container {
-            padding-top: 2rem !important;
-            padding-bottom: 2rem !important;
-            max-width: 1400px !important;
-            background: transparent !important;
-        }
-
-        /* Modern Card Design */
-        .osrs-card {
-            background: var(--bg-card) !important;
-            backdrop-filter: blur(20px) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-radius: 16px !important;
-            padding: 24px !important;
-            margin: 16px 0 !important;
-            box-shadow: var(--shadow-card) !important;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        }
-
-        .osrs-card:hover {
-            background: var(--bg-card-hover) !important;
-            border-color: var(--border-accent) !important;
-            transform: translateY(-4px) !important;
-            box-shadow: 0 12px 48px rgba(0, 0, 0, 0.5) !important;
-        }
-
-        /* Modern Headers */
-        h1, h2, h3, h4, h5, h6 {
-            color: var(--text-primary) !important;
-            font-weight: 600 !important;
-            letter-spacing: -0.025em !important;
-            margin-bottom: 1rem !important;
-        }
-
-        h1 {
-            font-size: 2.5rem !important;
-            background: linear-gradient(135deg, var(--osrs-gold), var(--osrs-gold-dark)) !important;
-            -webkit-background-clip: text !important;
-            -webkit-text-fill-color: transparent !important;
-            background-clip: text !important;
-            text-shadow: none !important;
-        }
-
-        h2 {
-            font-size: 1.875rem !important;
-            color: var(--text-accent) !important;
-        }
-
-        h3 {
-            font-size: 1.5rem !important;
-            color: var(--osrs-blue-light) !important;
-        }
-
-        /* Enhanced Buttons */
-        .stButton > button {
-            background: linear-gradient(135deg, var(--osrs-blue), var(--osrs-blue-light)) !important;
-            border: none !important;
-            border-radius: 12px !important;
-            color: white !important;
-            font-weight: 500 !important;
-            font-size: 0.875rem !important;
-            padding: 0.75rem 1.5rem !important;
-            transition: all 0.2s ease !important;
-            box-shadow: var(--shadow-button) !important;
-            text-transform: none !important;
-            letter-spacing: 0.025em !important;
-        }
-
-        .stButton > button:hover {
-            transform: translateY(-2px) !important;
-            box-shadow: 0 8px 24px rgba(74, 144, 226, 0.3) !important;
-            background: linear-gradient(135deg, var(--osrs-blue-light), var(--osrs-blue)) !important;
-        }
-
-        .stButton > button:active {
-            transform: translateY(0) !important;
-        }
-
-        /* Primary Button Variant */
-        .stButton > button[kind="primary"] {
-            background: linear-gradient(135deg, var(--osrs-gold), var(--osrs-gold-dark)) !important;
-            color: var(--bg-primary) !important;
-            font-weight: 600 !important;
-        }
-
-        .stButton > button[kind="primary"]:hover {
-            background: linear-gradient(135deg, var(--osrs-gold-dark), var(--osrs-gold)) !important;
-            box-shadow: 0 8px 24px rgba(255, 215, 0, 0.4) !important;
-        }
-
-        /* Enhanced Metrics */
-        [data-testid="metric-container"] {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-radius: 12px !important;
-            padding: 20px !important;
-            backdrop-filter: blur(20px) !important;
-            transition: all 0.3s ease !important;
-            box-shadow: var(--shadow-card) !important;
-        }
-
-        [data-testid="metric-container"]:hover {
-            background: var(--bg-card-hover) !important;
-            border-color: var(--border-accent) !important;
-            transform: translateY(-2px) !important;
-        }
-
-        [data-testid="metric-container"] > div > div > div:first-child {
-            color: var(--text-accent) !important;
-            font-size: 1.875rem !important;
-            font-weight: 700 !important;
-            font-family: 'JetBrains Mono', monospace !important;
-        }
-
-        [data-testid="metric-container"] > div > div > div:last-child {
-            color: var(--text-secondary) !important;
-            font-size: 0.875rem !important;
-            font-weight: 500 !important;
-            text-transform: uppercase !important;
-            letter-spacing: 0.1em !important;
-        }
-
-        /* Enhanced Sidebar */
-        .css-1d391kg, .css-1cypcdb, .css-17eq0hr {
-            background: var(--bg-secondary) !important;
-            border-right: 1px solid var(--border-primary) !important;
-            backdrop-filter: blur(20px) !important;
-        }
+import streamlit as st
+import streamlit.components.v1 as components
 
-        .css-1d391kg .stSelectbox > div > div {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-radius: 8px !important;
-            color: var(--text-primary) !important;
-        }
+try:
+    import tinycss2
+except ImportError:
+    # tinycss2 is optional - without it the theme CSS is shipped unchecked
+    tinycss2 = None
 
-        .css-1d391kg .stSlider > div > div > div {
-            color: var(--text-accent) !important;
-        }
 
-        /* Enhanced Input Fields */
-        .stTextInput > div > div > input,
-        .stSelectbox > div > div > select,
-        .stNumberInput > div > div > input {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-radius: 8px !important;
-            color: var(--text-primary) !important;
-            font-size: 0.875rem !important;
-            transition: all 0.2s ease !important;
-        }
+def _read_stylesheet(name):
+    """Read a stylesheet that ships alongside this module"""
+    return files(__package__).joinpath(name).read_text(encoding="utf-8")
 
-        .stTextInput > div > div > input:focus,
-        .stSelectbox > div > div > select:focus,
-        .stNumberInput > div > div > input:focus {
-            border-color: var(--osrs-blue-light) !important;
-            box-shadow: 0 0 0 3px rgba(74, 144, 226, 0.1) !important;
-            outline: none !important;
-        }
 
-        /* Modern Table Styling */
-        .stDataFrame {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-radius: 12px !important;
-            overflow: hidden !important;
-        }
+def _check_css(css, name):
+    """Warn about rules and declarations the browser would silently drop"""
+    if tinycss2 is None:
+        return
 
-        .stDataFrame table {
-            background: transparent !important;
-            font-family: 'Inter', sans-serif !important;
-        }
+    def report(nodes):
+        for node in nodes:
+            if node.type == 'error':
+                print(f"⚠️ {name}:{node.source_line}: {node.message}")
+            elif node.type in ('qualified-rule', 'at-rule') and node.content is not None:
+                # Recurse so rules inside @media/@keyframes blocks are checked too
+                report(tinycss2.parse_blocks_contents(node.content, skip_comments=True, skip_whitespace=True))
 
-        .stDataFrame th {
-            background: var(--bg-tertiary) !important;
-            color: var(--text-accent) !important;
-            font-weight: 600 !important;
-            font-size: 0.8rem !important;
-            text-transform: uppercase !important;
-            letter-spacing: 0.05em !important;
-            border-bottom: 2px solid var(--border-accent) !important;
-            padding: 12px 8px !important;
-        }
+    report(tinycss2.parse_stylesheet(css, skip_comments=True, skip_whitespace=True))
 
-        .stDataFrame td {
-            border-bottom: 1px solid var(--border-primary) !important;
-            color: var(--text-primary) !important;
-            padding: 12px 8px !important;
-            font-size: 0.875rem !important;
-        }
 
-        .stDataFrame tr:hover {
-            background: rgba(255, 215, 0, 0.05) !important;
-        }
+def _minify_css(css):
+    """Strip comments and redundant whitespace from a CSS string and shorten hex colors"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    css = re.sub(r'#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3\b', r'#\1\2\3', css)
+    return css.replace(';}', '}').strip()
 
-        /* Status Indicators */
-        .status-excellent {
-            color: var(--osrs-green-light) !important;
-            font-weight: 600 !important;
-        }
 
-        .status-good {
-            color: var(--osrs-orange) !important;
-            font-weight: 600 !important;
-        }
+def _css_palette(css):
+    """Read the custom properties declared in the :root block, resolving references between them"""
+    root = re.search(r':root\s*\{(.*?)\}', re.sub(r'/\*.*?\*/', '', css, flags=re.S), re.S).group(1)
+    palette = {name: value.strip() for name, value in re.findall(r'(--[\w-]+):\s*([^;]+);', root)}
+    return {name: _inline_css_vars(value, palette) for name, value in palette.items()}
 
-        .status-caution {
-            color: var(--osrs-red-light) !important;
-            font-weight: 600 !important;
-        }
 
-        /* Expandable Sections */
-        .streamlit-expanderHeader {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-radius: 8px !important;
-            color: var(--text-primary) !important;
-            font-weight: 500 !important;
-        }
+def _inline_css_vars(css, palette):
+    """Replace var() references with their literal palette values"""
+    return re.sub(r'var\((--[\w-]+)\)', lambda m: palette.get(m.group(1), m.group(0)), css)
 
-        .streamlit-expanderContent {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-top: none !important;
-            border-radius: 0 0 8px 8px !important;
-        }
 
-        /* Success/Warning/Error Messages */
-        .stSuccess {
-            background: rgba(34, 139, 34, 0.1) !important;
-            border: 1px solid rgba(34, 139, 34, 0.3) !important;
-            border-radius: 8px !important;
-            color: var(--osrs-green-light) !important;
-        }
+def _minify_js(js):
+    """Drop indentation, blank lines and whole-line comments from a JS string"""
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
 
-        .stWarning {
-            background: rgba(255, 140, 0, 0.1) !important;
-            border: 1px solid rgba(255, 140, 0, 0.3) !important;
-            border-radius: 8px !important;
-            color: var(--osrs-orange) !important;
-        }
 
-        .stError {
-            background: rgba(220, 20, 60, 0.1) !important;
-            border: 1px solid rgba(220, 20, 60, 0.3) !important;
-            border-radius: 8px !important;
-            color: var(--osrs-red-light) !important;
-        }
+# Modern fonts - linked instead of @import so the CSS itself never waits on the font request
+_FONT_PRELOAD_HTML = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700'
+    '&family=JetBrains+Mono:wght@700&display=swap">'
+)
 
-        .stInfo {
-            background: rgba(74, 144, 226, 0.1) !important;
-            border: 1px solid rgba(74, 144, 226, 0.3) !important;
-            border-radius: 8px !important;
-            color: var(--osrs-blue-light) !important;
-        }
+# Above-the-fold rules, inlined so the first paint is already themed
+_CRITICAL_CSS = _read_stylesheet("theme_critical.css")
 
-        /* Pagination Controls */
-        .pagination-container {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-radius: 12px !important;
-            padding: 16px !important;
-            margin: 20px 0 !important;
-            text-align: center !important;
-            backdrop-filter: blur(20px) !important;
-        }
+# Below-the-fold and state-dependent rules, loaded after the critical sheet is in place
+_DEFERRED_CSS = _read_stylesheet("theme_deferred.css")
 
-        /* Loading Animations */
-        @keyframes osrs-pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
+# Runs in the parent app window next to the stylesheet loader
+_INTERACTIVE_JS = """
+    (function() {
+        // The component iframe can mount again (e.g. after the layout above it changes) -
+        // only initialise once per page
+        if (window.__osrsInit) return;
+        window.__osrsInit = true;
 
-        .osrs-loading {
-            animation: osrs-pulse 2s infinite;
-            color: var(--text-accent) !important;
-        }
+        // Add loading states with one delegated listener instead of one per button. Only a
+        // class is toggled - the button contents belong to React
+        document.addEventListener('click', function(e) {
+            const button = e.target.closest('.stButton button');
+            if (!button) return;
+            button.classList.add('osrs-loading');
+            setTimeout(() => button.classList.remove('osrs-loading'), 1000);
+        });
 
-        /* Scrollbar Styling */
-        ::-webkit-scrollbar {
-            width: 8px !important;
-            height: 8px !important;
-        }
+        // Enhanced hover effects - two delegated listeners cover every card, including ones
+        // Streamlit inserts later. Style writes wait for the next frame, one write per frame
+        // Users who ask for reduced motion keep the cards still
+        const reducedMotion = matchMedia('(prefers-reduced-motion: reduce)');
 
-        ::-webkit-scrollbar-track {
-            background: var(--bg-secondary) !important;
-            border-radius: 4px !important;
+        function setCardTransform(e, transform) {
+            if (reducedMotion.matches) return;
+            const card = e.target.closest('.osrs-card');
+            if (!card || card.contains(e.relatedTarget)) return;
+            requestAnimationFrame(() => { card.style.transform = transform; });
         }
 
-        ::-webkit-scrollbar-thumb {
-            background: var(--osrs-blue) !important;
-            border-radius: 4px !important;
-        }
+        document.addEventListener('mouseover', e => setCardTransform(e, 'translateY(-8px) scale(1.02)'));
+        document.addEventListener('mouseout', e => setCardTransform(e, 'translateY(0) scale(1)'));
 
-        ::-webkit-scrollbar-thumb:hover {
-            background: var(--osrs-blue-light) !important;
-        }
+        // Keyboard shortcuts
+        document.addEventListener('keydown', function(e) {
+            // Ordinary typing in filter inputs leaves straight away
+            if (!e.ctrlKey && e.key !== 'Escape') return;
 
-        /* Mobile Responsiveness */
-        @media (max-width: 768px) {
-            .main .block-container {
-                padding: 1rem !important;
-            }
-            
-            h1 {
-                font-size: 2rem !important;
+            // Ctrl+R to refresh - the browser reload still works on pages without the button
+            if (e.ctrlKey && e.key === 'r') {
+                const refreshBtn = document.querySelector('button[data-testid="refresh-data"]');
+                if (refreshBtn) {
+                    e.preventDefault();
+                    refreshBtn.click();
+                }
             }
-            
-            .osrs-card {
-                padding: 16px !important;
-                margin: 12px 0 !important;
+
+            // Escape to clear selection
+            if (e.key === 'Escape') {
+                const activeElement = document.activeElement;
+                if (activeElement) activeElement.blur();
             }
-            
-            [data-testid="metric-container"] {
-                padding: 16px !important;
+        });
+    })();
+"""
+
+# Runs in the parent app window (inline via _PARENT_SCRIPT_JS or fetched by _BOOTSTRAP_JS) and
+# attaches the theme as a constructable stylesheet, so the CSS is parsed once per page load
+# instead of per rerun and keeps working after a later rerun removes the component iframe
+_STYLESHEET_LOADER_JS = """
+    (function() {
+        // The component can run again on later reruns - only attach the theme once per page
+        if (window.__osrsSheet) return;
+        window.__osrsSheet = true;
+
+        const criticalCss = __OSRS_CRITICAL_CSS__;
+        const deferredUrl = __OSRS_CSS_URL__;
+        const deferredCss = __OSRS_CSS__;
+
+        function attachStylesheet(css) {
+            if ('adoptedStyleSheets' in document && 'replaceSync' in CSSStyleSheet.prototype) {
+                const sheet = new CSSStyleSheet();
+                sheet.replaceSync(css);
+                document.adoptedStyleSheets = [...document.adoptedStyleSheets, sheet];
+            } else {
+                // Older browsers - fall back to <style> elements in the app head
+                const style = document.createElement('style');
+                style.textContent = css;
+                document.head.appendChild(style);
             }
         }
 
-        /* Utility Classes */
-        .text-accent { color: var(--text-accent) !important; }
-        .text-primary { color: var(--text-primary) !important; }
-        .text-secondary { color: var(--text-secondary) !important; }
-        .text-muted { color: var(--text-muted) !important; }
-        
-        .bg-card { background: var(--bg-card) !important; }
-        .border-accent { border-color: var(--border-accent) !important; }
-        
-        .osrs-gold { color: var(--osrs-gold) !important; }
-        .osrs-blue { color: var(--osrs-blue-light) !important; }
-        .osrs-green { color: var(--osrs-green-light) !important; }
-        .osrs-red { color: var(--osrs-red-light) !important; }
-    </style>
-    """, unsafe_allow_html=True)
-
-
-def inject_interactive_javascript():
-    """Inject enhanced interactive JavaScript for better UX"""
-    st.markdown("""
-    <script>
-        // Modern page transitions
-        function initOSRSApp() {
-            // Add loading states
-            const buttons = document.querySelectorAll('.stButton button');
-            buttons.forEach(button => {
-                button.addEventListener('click', function() {
-                    this.innerHTML = '<span class="osrs-loading">Loading...</span>';
-                    setTimeout(() => {
-                        this.innerHTML = this.getAttribute('data-original-text') || 'Processing';
-                    }, 1000);
-                });
-            });
-
-            // Enhanced hover effects
-            const cards = document.querySelectorAll('.osrs-card');
-            cards.forEach(card => {
-                card.addEventListener('mouseenter', function() {
-                    this.style.transform = 'translateY(-8px) scale(1.02)';
-                });
-                card.addEventListener('mouseleave', function() {
-                    this.style.transform = 'translateY(0) scale(1)';
-                });
-            });
-
-            // Keyboard shortcuts
-            document.addEventListener('keydown', function(e) {
-                // Ctrl+R to refresh
-                if (e.ctrlKey && e.key === 'r') {
-                    e.preventDefault();
-                    const refreshBtn = document.querySelector('button[data-testid="refresh-data"]');
-                    if (refreshBtn) refreshBtn.click();
-                }
-                
-                // Escape to clear selection
-                if (e.key === 'Escape') {
-                    const activeElement = document.activeElement;
-                    if (activeElement) activeElement.blur();
-                }
-            });
-        }
+        document.head.insertAdjacentHTML('beforeend', __OSRS_FONTS__);
+        attachStylesheet(criticalCss);
 
-        // Initialize when page loads
-        if (document.readyState === 'loading') {
-            document.addEventListener('DOMContentLoaded', initOSRSApp);
+        if (deferredUrl) {
+            // Served from the app static folder, so the browser HTTP cache keeps it between loads
+            fetch(new URL(deferredUrl, location.href))
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                    return response.text();
+                })
+                .then(attachStylesheet)
+                .catch(error => console.warn('OSRS theme: deferred stylesheet not loaded', error));
         } else {
-            initOSRSApp();
+            setTimeout(() => attachStylesheet(deferredCss), 0);
         }
+    })();
+"""
 
-        // Reinitialize on Streamlit updates
-        window.addEventListener('load', function() {
-            setTimeout(initOSRSApp, 1000);
-        });
-    </script>
-    """, unsafe_allow_html=True)
-
-
-# Legacy compatibility - keep for now
-def inject_main_styles():
-    """Legacy function - redirects to modern styles"""
-    inject_modern_osrs_styles()
+# Runs in the parent app window and fetches the published theme loader. It is fetched as text and
+# run inline because the static folder does not always serve .js files with a script MIME type
+_BOOTSTRAP_JS = """
+    (function() {
+        if (window.__osrsSheet) return;
+        fetch(new URL(__OSRS_JS_URL__, location.href))
+            .then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.text();
+            })
+            .then(code => {
+                const script = document.createElement('script');
+                script.textContent = code;
+                document.head.appendChild(script);
+                script.remove();
+            })
+            .catch(error => console.warn('OSRS theme: loader not loaded', error));
+    })();
+"""
 
+# Runs in the zero-height component iframe and hands the theme scripts over to the parent
+# document, so their callbacks belong to the parent window and survive the iframe being removed
+_PARENT_SCRIPT_JS = """
+    const doc = window.parent.document;
+    const script = doc.createElement('script');
+    script.textContent = __OSRS_SCRIPT__;
+    doc.head.appendChild(script);
+    script.remove();
+"""
 
-def inject_interactive_javascript_legacy():
-    """Legacy function - redirects to modern JS"""
-    inject_interactive_javascript()
\ No newline at end of file
+_STATIC_DIR = Path(__file__).resolve().parents[2] / "static"
+
+
+def _js_string(value):
+    """Encode a Python string as a JS string literal that is safe inside <script>"""
+    return json.dumps(value).replace('</', '<\\/')
+
+
+def _publish_static(text, extension):
+    """Write text to the app static folder under a content-hashed name and return its URL"""
+    if not st.get_option("server.enableStaticServing"):
+        return None
+
+    filename = f"osrs.{hashlib.sha1(text.encode('utf-8')).hexdigest()[:8]}.{extension}"
+    path = _STATIC_DIR / filename
+    try:
+        if not path.exists():
+            _STATIC_DIR.mkdir(exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+    except OSError as e:
+        print(f"⚠️ Could not write static {extension} asset, inlining instead: {e}")
+        return None
+    return f"app/static/{filename}"
+
+
+def _parent_script_html(js):
+    """Wrap a script for the component iframe so it runs in the parent app window"""
+    return "<script>\n{}\n</script>".format(
+        _minify_js(_PARENT_SCRIPT_JS).replace('__OSRS_SCRIPT__', _js_string(js))
+    )
+
+
+# Minified once at import so the theme component is built from constants
+# The palette never changes at runtime, so the theme rules get literal colors. The :root block
+# stays in place for the inline component markup that still references the variables
+_check_css(_CRITICAL_CSS, "theme_critical.css")
+_check_css(_DEFERRED_CSS, "theme_deferred.css")
+_PALETTE = _css_palette(_CRITICAL_CSS)
+_CRITICAL_CSS_MIN = _minify_css(_inline_css_vars(_CRITICAL_CSS, _PALETTE))
+_DEFERRED_CSS_MIN = _minify_css(_inline_css_vars(_DEFERRED_CSS, _PALETTE))
+
+
+@cache
+def _theme_loader_js():
+    """Build the theme loader once per process, publishing the deferred CSS on first use"""
+    deferred_url = _publish_static(_DEFERRED_CSS_MIN, "css")
+    return (
+        _minify_js(_STYLESHEET_LOADER_JS)
+        .replace('__OSRS_FONTS__', _js_string(_FONT_PRELOAD_HTML))
+        .replace('__OSRS_CRITICAL_CSS__', _js_string(_CRITICAL_CSS_MIN))
+        .replace('__OSRS_CSS_URL__', _js_string(deferred_url))
+        .replace('__OSRS_CSS__', _js_string(None if deferred_url else _DEFERRED_CSS_MIN))
+        + '\n' + _minify_js(_INTERACTIVE_JS)
+    )
+
+
+@cache
+def _theme_bootstrap_html():
+    """Publish the theme loader and return the small component that fetches it (None if inlined)"""
+    loader_url = _publish_static(_theme_loader_js(), "js")
+    if not loader_url:
+        return None
+    return _parent_script_html(_minify_js(_BOOTSTRAP_JS).replace('__OSRS_JS_URL__', _js_string(loader_url)))
+
+
+def inject_osrs_theme():
+    """Inject the OSRS theme styles and interactive JavaScript in a single component"""
+    bootstrap_html = _theme_bootstrap_html()
+    if bootstrap_html:
+        # A few hundred bytes, sent on every rerun so the unchanged component stays mounted
+        # until it has run; the loader itself only initialises once per page
+        components.html(bootstrap_html, height=0)
+        return
+
+    # Without static serving the whole loader travels inline, so send it once per session.
+    # It runs in the parent window, so it keeps working after later reruns drop the iframe
+    if st.session_state.get("_osrs_theme_v1"):
+        return
+    st.session_state["_osrs_theme_v1"] = True
+    components.html(_parent_script_html(_theme_loader_js()), height=0)
@@ -4,8 +4,11 @@ Implements multi-level caching for optimal performance
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
+import threading
 import time
+from collections import deque
 from functools import wraps
 from typing import Any, Optional, Callable
 
@@ -13,67 +16,83 @@ from typing import Any, Optional, Callable
 class PerformanceCache:
     """Multi-level caching system for OSRS data"""
 
+    __slots__ = ('hits', 'misses', 'total_requests')
+
     def __init__(self):
-        self.cache_stats = {
-            'hits': 0,
-            'misses': 0,
-            'total_requests': 0
-        }
+        self.hits = 0
+        self.misses = 0
+        self.total_requests = 0
 
     def get_hit_rate(self) -> float:
         """Calculate cache hit rate percentage"""
-        if self.cache_stats['total_requests'] == 0:
+        if self.total_requests == 0:
             return 0.0
-        return (self.cache_stats['hits'] / self.cache_stats['total_requests']) * 100
+        return (self.hits / self.total_requests) * 100
 
     def record_hit(self):
         """Record cache hit"""
-        self.cache_stats['hits'] += 1
-        self.cache_stats['total_requests'] += 1
+        self.hits += 1
+        self.total_requests += 1
 
     def record_miss(self):
         """Record cache miss"""
-        self.cache_stats['misses'] += 1
-        self.cache_stats['total_requests'] += 1
+        self.misses += 1
+        self.total_requests += 1
 
 
 # Global cache instance
 performance_cache = PerformanceCache()
 
+# Cap on per-session timing records kept for the performance dashboard
+MAX_PERFORMANCE_METRICS = 200
+
+
+# Set when a tracked function actually runs, i.e. Streamlit's cache missed
+_cache_state = threading.local()
+
 
-def cache_with_performance_tracking(ttl: int = 300):
+def cache_with_performance_tracking(ttl: int = 300, hash_funcs: Optional[dict] = None):
     """Decorator to add performance tracking to Streamlit cache"""
 
     def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def compute(*args, **kwargs):
+            _cache_state.computed = True
+            return func(*args, **kwargs)
+
         # Apply Streamlit cache
-        cached_func = st.cache_data(ttl=ttl)(func)
+        cached_func = st.cache_data(ttl=ttl, hash_funcs=hash_funcs)(compute)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
-
-            # Check if data is in cache
-            cache_key = str(args) + str(sorted(kwargs.items()))
+            start_time = time.perf_counter()
+            _cache_state.computed = False
 
             try:
                 result = cached_func(*args, **kwargs)
-                performance_cache.record_hit()
             except Exception:
+                if _cache_state.computed:
+                    raise
+                # Streamlit couldn't hash the arguments - run uncached
                 result = func(*args, **kwargs)
+                _cache_state.computed = True
+
+            if _cache_state.computed:
                 performance_cache.record_miss()
+            else:
+                performance_cache.record_hit()
 
-            end_time = time.time()
-            execution_time = end_time - start_time
+            execution_time = time.perf_counter() - start_time
 
-            # Store performance metrics
+            # Store performance metrics - only the most recent calls are kept
             if 'performance_metrics' not in st.session_state:
-                st.session_state.performance_metrics = []
+                st.session_state.performance_metrics = deque(maxlen=MAX_PERFORMANCE_METRICS)
 
             st.session_state.performance_metrics.append({
                 'function': func.__name__,
                 'execution_time': execution_time,
                 'timestamp': time.time(),
-                'cached': performance_cache.cache_stats['hits'] > 0
+                'cached': not _cache_state.computed
             })
 
             return result
@@ -90,16 +109,28 @@ def get_cached_market_data(mode: str):
     return run_flip_scanner(mode)
 
 
-@cache_with_performance_tracking(ttl=300)  # 5 minutes for processed data
+def _analysis_fingerprint(df: pd.DataFrame):
+    """Cheap cache key for analysis frames - shape plus column sums instead of hashing every cell"""
+    if df.empty:
+        return df.shape
+    return (df.shape, float(np.nansum(df['profit'].to_numpy())),
+            float(np.nansum(df['risk_score'].to_numpy())), float(np.nansum(df['volume'].to_numpy())))
+
+
+@cache_with_performance_tracking(ttl=300, hash_funcs={pd.DataFrame: _analysis_fingerprint})  # 5 minutes for processed data
 def get_cached_analysis_data(df: pd.DataFrame):
     """Cache analysis calculations with 5-minute TTL"""
     if df.empty:
         return {}
 
+    # Count straight off the NumPy arrays instead of materializing filtered frames
+    profit = df['profit'].to_numpy()
+    risk = df['risk_score'].to_numpy()
+
     return {
         'total_opportunities': len(df),
-        'exceptional_count': len(df[df['profit'] >= 100000]),
-        'safe_trades': len(df[df['risk_score'] <= 3]),
+        'exceptional_count': int((profit >= 100000).sum()),
+        'safe_trades': int((risk <= 3).sum()),
         'avg_profit': df['profit'].mean(),
         'total_volume': df['volume'].sum()
     }
@@ -109,7 +140,7 @@ def get_performance_stats():
     """Get current performance statistics"""
     return {
         'hit_rate': performance_cache.get_hit_rate(),
-        'total_requests': performance_cache.cache_stats['total_requests'],
-        'hits': performance_cache.cache_stats['hits'],
-        'misses': performance_cache.cache_stats['misses']
+        'total_requests': performance_cache.total_requests,
+        'hits': performance_cache.hits,
+        'misses': performance_cache.misses
     }
\ No newline at end of file
@@ -8,6 +8,10 @@ import traceback
 import functools
 from typing import Any, Callable, Optional
 
+# Fragments (Streamlit 1.37+, experimental from 1.33) rerun only their own widgets;
+# older versions fall back to a plain function and a full rerun
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
 
 class ErrorHandler:
     """Centralized error handling with user-friendly messages"""
@@ -34,8 +38,7 @@ class ErrorHandler:
     @staticmethod
     def handle_data_error(error: Exception, context: str = "Data processing"):
         """Handle data processing errors"""
-        st.error(f"📊 **{context} Error**: {error}")
-        st.info("💡 **Tip**: Try refreshing the data or adjusting your filters.")
+        st.error(f"📊 **{context} Error**: {error}\n\n💡 **Tip**: Try refreshing the data or adjusting your filters.")
 
         with st.expander("🔧 Technical Details"):
             st.code(str(error))
@@ -43,8 +46,7 @@ class ErrorHandler:
     @staticmethod
     def handle_ui_error(error: Exception, context: str = "Interface"):
         """Handle UI-related errors"""
-        st.warning(f"🎨 **{context} Issue**: {error}")
-        st.info("The app is still functional - this is just a display issue.")
+        st.warning(f"🎨 **{context} Issue**: {error}\n\nThe app is still functional - this is just a display issue.")
 
 
 def safe_execute(error_context: str = "Operation", show_traceback: bool = False):
@@ -80,8 +82,13 @@ def safe_execute(error_context: str = "Operation", show_traceback: bool = False)
 
 def create_error_recovery_section():
     """Create a section with error recovery options"""
-    st.markdown("---")
-    st.markdown("### 🚨 Having Issues?")
+    st.markdown("---\n### 🚨 Having Issues?")
+    _error_recovery_buttons()
+
+
+@fragment
+def _error_recovery_buttons():
+    """Recovery buttons - a connection test only reruns this fragment, not the whole app"""
 
     col1, col2, col3 = st.columns(3)
 
@@ -5,8 +5,19 @@ Helper functions for GE tax, buy limits, and item categorization
 
 import json
 import math
+import re
+from functools import cache, lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Category definitions
 CATEGORY_KEYWORDS = {
     'Raw Materials': ['ore', 'log', 'fish', 'bar', 'gem'],
@@ -18,6 +29,10 @@ CATEGORY_KEYWORDS = {
 
 def calculate_ge_tax(price):
     """Calculate Grand Exchange tax (2% capped at 5M) with NaN handling"""
+    # Fast path: exact integer math for plain int prices (price // 50 == floor(price * 0.02))
+    if type(price) is int:
+        return min(price // 50, 5_000_000) if price > 0 else 0
+
     # Handle NaN, None, and invalid values
     if price is None or pd.isna(price) or not isinstance(price, (int, float)):
         return 0
@@ -33,56 +48,90 @@ def calculate_ge_tax(price):
         return 0
 
 
+def calculate_ge_tax_array(prices):
+    """Vectorized GE tax for a whole price column (NaN and non-positive prices pay 0)"""
+    arr = np.nan_to_num(np.asarray(prices, dtype=np.float64), nan=0.0, posinf=0.0, neginf=0.0)
+    # price // 50 == floor(price * 0.02) without the float multiply rounding
+    return np.minimum(np.clip(arr, 0, None) // 50, 5_000_000).astype(np.int64)
+
+
+# Flattened (keyword, category) pairs, in category priority order
+_CATEGORY_KEYWORD_PAIRS = tuple((kw, cat) for cat, kws in CATEGORY_KEYWORDS.items() for kw in kws)
+
+
+@lru_cache(maxsize=8192)
 def categorize_item(name):
     """Categorize item based on name keywords"""
     lname = name.lower()
-    for cat, kws in CATEGORY_KEYWORDS.items():
-        if any(kw in lname for kw in kws):
+    for kw, cat in _CATEGORY_KEYWORD_PAIRS:
+        if kw in lname:
             return cat
     return 'Other'
 
 
+# One compiled alternation per category, in category priority order
+_CATEGORY_PATTERNS = {
+    cat: re.compile('|'.join(map(re.escape, kws))) for cat, kws in CATEGORY_KEYWORDS.items()
+}
+
+
+def categorize_series(names):
+    """Categorize a Series of item names in one vectorized pass"""
+    lower = names.astype(str).str.lower()
+    conds = [lower.str.contains(p, regex=True).to_numpy(dtype=bool) for p in _CATEGORY_PATTERNS.values()]
+    return pd.Series(np.select(conds, list(_CATEGORY_PATTERNS), default='Other'), index=names.index)
+
+
+# Fallback buy limits used when ge_limits.json is missing (read-only, shared process-wide)
+_DEFAULT_LIMITS = MappingProxyType({
+    # High volume items
+    "Air rune": 12000, "Water rune": 12000, "Earth rune": 12000, "Fire rune": 12000,
+    "Pure essence": 25000, "Rune essence": 25000, "Logs": 25000, "Oak logs": 25000,
+    "Willow logs": 25000, "Coal": 1000, "Iron ore": 1000, "Gold ore": 300,
+
+    # Combat items
+    "Dragon bones": 25000, "Cannonball": 5000, "Rune arrow": 11000, "Adamant arrow": 9000,
+    "Blood rune": 25000, "Death rune": 11000, "Nature rune": 1000, "Law rune": 1000,
+
+    # Food
+    "Lobster": 1000, "Swordfish": 1000, "Shark": 1000, "Anglerfish": 1000,
+    "Raw lobster": 1000, "Raw swordfish": 1000, "Raw shark": 1000,
+
+    # Potions & supplies
+    "Prayer potion(4)": 100, "Super combat potion(4)": 100, "Amylase crystal": 100,
+    "Grimy ranarr weed": 80, "Grimy snapdragon": 80, "Grimy torstol": 80,
+
+    # Seeds
+    "Ranarr seed": 5, "Snapdragon seed": 5, "Torstol seed": 5,
+
+    # Gems
+    "Uncut diamond": 50, "Uncut ruby": 50, "Uncut emerald": 50, "Uncut sapphire": 50,
+
+    # High-value items (typical 8 limit)
+    "Abyssal whip": 8, "Dragon claws": 8, "Bandos chestplate": 8, "Bandos tassets": 8,
+    "Dragon warhammer": 8, "Toxic blowpipe": 8, "Trident of the seas": 8,
+
+    # Ultra-rare items (typical 2 limit)
+    "Twisted bow": 2, "Elysian spirit shield": 2, "Scythe of vitur": 2
+})
+
+
+@cache
+def _load_buy_limits():
+    """Read and parse ge_limits.json once per process; errors propagate so they are never cached"""
+    limits = _json_loads(Path('ge_limits.json').read_bytes())
+    print(f"✅ Loaded {len(limits)} buy limits from file")
+    # Shared by every session, so hand out a read-only view like _DEFAULT_LIMITS
+    return MappingProxyType(limits)
+
+
 def get_buy_limits():
     """Load GE buy limits from file, with intelligent defaults if file missing"""
     try:
-        with open('ge_limits.json', 'r') as f:
-            limits = json.load(f)
-            print(f"✅ Loaded {len(limits)} buy limits from file")
-            return limits
+        return _load_buy_limits()
     except FileNotFoundError:
         print("⚠️ ge_limits.json not found, using default buy limits")
-        default_limits = {
-            # High volume items
-            "Air rune": 12000, "Water rune": 12000, "Earth rune": 12000, "Fire rune": 12000,
-            "Pure essence": 25000, "Rune essence": 25000, "Logs": 25000, "Oak logs": 25000,
-            "Willow logs": 25000, "Coal": 1000, "Iron ore": 1000, "Gold ore": 300,
-
-            # Combat items
-            "Dragon bones": 25000, "Cannonball": 5000, "Rune arrow": 11000, "Adamant arrow": 9000,
-            "Blood rune": 25000, "Death rune": 11000, "Nature rune": 1000, "Law rune": 1000,
-
-            # Food
-            "Lobster": 1000, "Swordfish": 1000, "Shark": 1000, "Anglerfish": 1000,
-            "Raw lobster": 1000, "Raw swordfish": 1000, "Raw shark": 1000,
-
-            # Potions & supplies
-            "Prayer potion(4)": 100, "Super combat potion(4)": 100, "Amylase crystal": 100,
-            "Grimy ranarr weed": 80, "Grimy snapdragon": 80, "Grimy torstol": 80,
-
-            # Seeds
-            "Ranarr seed": 5, "Snapdragon seed": 5, "Torstol seed": 5,
-
-            # Gems
-            "Uncut diamond": 50, "Uncut ruby": 50, "Uncut emerald": 50, "Uncut sapphire": 50,
-
-            # High-value items (typical 8 limit)
-            "Abyssal whip": 8, "Dragon claws": 8, "Bandos chestplate": 8, "Bandos tassets": 8,
-            "Dragon warhammer": 8, "Toxic blowpipe": 8, "Trident of the seas": 8,
-
-            # Ultra-rare items (typical 2 limit)
-            "Twisted bow": 2, "Elysian spirit shield": 2, "Scythe of vitur": 2
-        }
-        return default_limits
+        return _DEFAULT_LIMITS
     except Exception as e:
         print(f"❌ Error loading buy limits: {e}")
-        return {}
\ No newline at end of file
+        return {}